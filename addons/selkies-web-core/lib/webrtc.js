@@ -361,6 +361,12 @@ export class WebRTCDemo {
 	_onPeerdDataChannel(event) {
 		this._setStatus("Peer data channel created: " + event.channel.label);
 
+		// The stats and files channels only carry server messages, input is sent over the primary channel.
+		if (event.channel.label === "stats" || event.channel.label === "files") {
+			event.channel.onmessage = this._onPeerDataChannelMessage.bind(this);
+			return;
+		}
+
 		// Bind the data channel event handlers.
 		this._send_channel = event.channel;
 		this._send_channel.onmessage = this._onPeerDataChannelMessage.bind(this);
@@ -398,6 +404,20 @@ export class WebRTCDemo {
 
 		this._setDebug("data channel message: " + event.data);
 
+		if (msg.type === 'batch') {
+			// Server coalesces messages queued within the same tick
+			msg.data.forEach((m) => this._handleDataChannelMessage(m));
+		} else {
+			this._handleDataChannelMessage(msg);
+		}
+	}
+
+	/**
+	 * Handles a single parsed message from the peer data channel.
+	 *
+	 * @param {Object} msg
+	 */
+	_handleDataChannelMessage(msg) {
 		if (msg.type === 'pipeline') {
 			this._setStatus(msg.data.status);
 		} else if (msg.type === 'gpu_stats') {
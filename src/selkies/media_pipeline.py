@@ -105,6 +105,8 @@ class MediaPipelinePixel(MediaPipeline):
         self.audio_channels = audio_channels
         self.encoder_rtc = encoder_rtc
         self.framerate = framerate
+        # RTP video clock ticks per captured frame, updated with the framerate
+        self._pts_step = 90000 // framerate
         self.video_bitrate = video_bitrate
         self.rc_mode = rc_mode
         # FIXME: h264_crf variable name could be encoder agnostic
@@ -257,6 +259,7 @@ class MediaPipelinePixel(MediaPipeline):
                 return
 
             self.framerate = framerate
+            self._pts_step = 90000 // framerate
             await self.async_event_loop.run_in_executor(
                 None, self.capture_module.update_framerate, float(self.framerate)
             )
@@ -311,16 +314,21 @@ class MediaPipelinePixel(MediaPipeline):
                 return
             try:
                 result = result_ptr.contents
-                if result.size > 0:
-                    data_bytes = bytes(result.data[10 : result.size])
+                # The encoded frame follows a 10 byte header
+                if result.size > 10:
+                    # Copy the encoded frame in a single memcpy, slicing the
+                    # ctypes pointer would build a list of ints first
+                    data_bytes = ctypes.string_at(
+                        ctypes.cast(result.data, ctypes.c_void_p).value + 10,
+                        result.size - 10,
+                    )
                     if not hasattr(result, "frame_id"):
                         logger.error(
                             f"Missing frame_id from screen capture result, skipping frame"
                         )
                     else:
                         # Generate pts from frame_id
-                        pts_step = 90000 // self.framerate
-                        pts = result.frame_id * pts_step
+                        pts = result.frame_id * self._pts_step
                         asyncio.run_coroutine_threadsafe(
                             self.produce_data(data_bytes, pts, "video"),
                             self.async_event_loop,
@@ -405,12 +413,7 @@ class MediaPipelinePixel(MediaPipeline):
                 try:
                     result = result_ptr.contents
                     if result.data and result.size > 0:
-                        data_bytes = bytes(
-                            ctypes.cast(
-                                result.data,
-                                ctypes.POINTER(ctypes.c_ubyte * result.size),
-                            ).contents
-                        )
+                        data_bytes = ctypes.string_at(result.data, result.size)
 
                         asyncio.run_coroutine_threadsafe(
                             self.produce_data(data_bytes, result.pts, "audio"),
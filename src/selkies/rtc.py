@@ -28,7 +28,6 @@ import urllib.parse
 
 from .webrtc import (
     RTCPeerConnection,
-    RTCIceCandidate,
     RTCRtpSender,
     RTCSessionDescription,
     VideoStreamTrack,
@@ -49,9 +48,50 @@ from .webrtc.contrib.media import MediaRelay
 from enum import Enum
 from .media_pipeline import MediaPipeline
 
+# orjson encodes data channel messages considerably faster when available
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    json_dumps = json.dumps
+
 # leave some room for metadata in the data channel message
 CLIPBOARD_CHUNK_SIZE = 65535 - 150
 
+# RTP clock rates of the video and audio streams
+RTP_VIDEO_CLOCK_RATE = 90000
+RTP_AUDIO_CLOCK_RATE = 48000
+
+# Upper bound of a coalesced data channel message, kept below the 65535 limit
+DATA_CHANNEL_BATCH_SIZE = 60 * 1024
+
+# Server created data channels, audio and video never go over them:
+#   input -- reliable and ordered, small input and control messages
+#   stats -- unreliable and unordered, small periodic stats
+#   files -- reliable and ordered, large payloads such as the clipboard
+# Messages go over the input channel unless their type is listed below.
+STATS_MESSAGE_TYPES = frozenset({"gpu_stats", "system_stats", "ping", "latency_measurement"})
+FILES_MESSAGE_TYPES = frozenset({"clipboard-msg", "clipboard-msg-start", "clipboard-msg-data", "clipboard-msg-end"})
+
+# Large payloads are paced so that at most this many bytes wait on the files
+# channel, the SCTP transport drains all channels through a single FIFO queue
+FILES_CHANNEL_BUFFER_THRESHOLD = 0
+
+# Stats messages are held back while this many bytes are queued on the stats
+# channel, about two ticks of the ~230 B/s of stats sent once per second
+STATS_CHANNEL_BUFFER_THRESHOLD = 512
+# Time sensitive stats messages, dropped instead of held back while congested
+# since a delayed ping would produce a bogus latency measurement
+STATS_DROPPABLE_TYPES = frozenset({"ping", "latency_measurement"})
+
+# SDP munging patterns, compiled once at import
+RTX_APT_REGEX = re.compile(r'(apt=\d+)')
+RTX_TIME_REGEX = re.compile(r'rtx-time=\d+')
+SPS_PPS_IDR_REGEX = re.compile(r'sps-pps-idr-in-keyframe=\d+')
+OPUS_SPROP_REGEX = re.compile(r'([^-]sprop-[^\r\n]+)')
+
 logger = logging.getLogger("rtc")
 logger.setLevel(logging.INFO)
 
@@ -92,6 +132,23 @@ def get_adjusted_chunk_size() -> int:
     """
     return (CLIPBOARD_CHUNK_SIZE * 3) // 4
 
+def encode_clipboard_chunks(data: bytes, chunk_size: int) -> List[str]:
+    """Splits data into chunks of chunk_size bytes and base64 encodes each of them."""
+    return [
+        base64.b64encode(data[i:i + chunk_size]).decode("utf-8")
+        for i in range(0, len(data), chunk_size)
+    ]
+
+def build_packet(buf: bytes, time_base: Fraction, pts: Optional[int], set_dts: bool = False) -> av.Packet:
+    """Wraps an encoded frame into an av.Packet with the given timing."""
+    packet = av.Packet(buf)
+    packet.time_base = time_base
+    if pts is not None:
+        packet.pts = pts
+        if set_dts:
+            packet.dts = pts
+    return packet
+
 class ClientType(str, Enum):
     CONTROLLER = "controller"
     VIEWER = "viewer"
@@ -102,20 +159,31 @@ class RTCAppError(Exception):
 class PipelineBridge:
     """A bridge to asynchronously pass data between Media and the RTC pipeline"""
     def __init__(self):
-        self._lock = asyncio.Lock()
-        self._queue = asyncio.Queue(maxsize=1)
-
-    async def set_data(self, data: Any):
-        # If the queue is already full, it means the consumer is lagging so
-        # remove the old item to make space for the new one.
-        async with self._lock:
-            if self._queue.full():
-                self._queue.get_nowait()
-            self._queue.put_nowait(data)
+        self._waiter: Optional[asyncio.Future] = None
+        self._value = None
+        self._has_value = False
+
+    def set_data(self, data: Any):
+        # Only the latest item is kept; if the consumer is lagging the
+        # previous item is simply overwritten.
+        self._value = data
+        self._has_value = True
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
 
     async def get_data(self):
-        # asynchronously wait until an item is available in the queue
-        return await self._queue.get()
+        # asynchronously wait until an item is available in the slot
+        if not self._has_value:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        data = self._value
+        self._value = None
+        self._has_value = False
+        return data
 
 class AudioMedia(AudioStreamTrack):
     def __init__(self, data_pipeline: PipelineBridge):
@@ -150,9 +218,24 @@ class RTCApp:
         self.async_event_loop = async_event_loop
         self.stun_servers = stun_servers
         self.turn_servers = turn_servers
+        # ICE servers are parsed once and reused by every peer connection
+        self._ice_servers = self.build_ice_servers(stun_servers, turn_servers)
         self.encoder = encoder
         self.last_cursor_sent = None
 
+        # Stream time bases are invariant, build them once instead of per packet
+        self._video_time_base = Fraction(1, RTP_VIDEO_CLOCK_RATE)
+        self._audio_time_base = Fraction(1, RTP_AUDIO_CLOCK_RATE)
+
+        # Data channel messages queued within the current event loop tick,
+        # keyed by the peer object's channel key
+        self._pending_msgs: Dict[str, List[str]] = {"data_channel": [], "stats_channel": [], "files_channel": []}
+        self._pending_size: Dict[str, int] = {"data_channel": 0, "stats_channel": 0, "files_channel": 0}
+        self._flush_scheduled = False
+        # Stats messages held back while the stats channel is congested
+        # keyed by message type, only the latest message of each type is kept
+        self._stats_backlog: Dict[str, str] = {}
+
         self.audio_pipeline_bridge = None
         self.video_pipeline_bridge = None
         self.media_relay = None
@@ -161,7 +244,7 @@ class RTCApp:
         # Data channel events
         self.on_data_open = lambda: logger.warning('unhandled on_data_open')
         self.on_data_close = lambda: logger.warning('unhandled on_data_close')
-        self.on_data_error = lambda: logger.warning('unhandled on_data_error')
+        self.on_data_error = lambda e: logger.warning('unhandled on_data_error')
         self.on_data_message = lambda msg: logger.warning('unhandled on_data_message')
         self.on_data_msg_bytes = lambda data: logger.warning('unhandled on_data_msg_bytes')
 
@@ -187,14 +270,12 @@ class RTCApp:
         peer_conn = peer_obj["peer_conn"]
         if peer_conn.connectionState in ["closed", "failed"]:
             logger.warning(
-                f"Ignoring remote SDP: peer connection in {peer_conn.connectionState} state",
+                "Ignoring remote SDP: peer connection in %s state", peer_conn.connectionState,
                 extra={'client_peer_id': client_peer_id, 'client_type': peer_obj.get('client_type')}
             )
             return
 
-        sdp = RTCSessionDescription(sdp=sdp, type=sdp_type)
-        if isinstance(sdp, RTCSessionDescription):
-            await peer_conn.setRemoteDescription(sdp)
+        await peer_conn.setRemoteDescription(RTCSessionDescription(sdp=sdp, type=sdp_type))
 
     async def set_ice(self, ice: Dict, client_peer_id: str):
         """Adds ice candidate received from signaling server"""
@@ -208,7 +289,7 @@ class RTCApp:
         peer_conn = peer_obj["peer_conn"]
         if peer_conn.connectionState in ["closed", "failed"]:
             logger.warning(
-                f"Ignoring adding ICE candidate: peer connection in {peer_conn.connectionState} state",
+                "Ignoring adding ICE candidate: peer connection in %s state", peer_conn.connectionState,
                 extra={'client_peer_id': client_peer_id, 'client_type': peer_obj.get('client_type')}
             )
             return
@@ -227,10 +308,7 @@ class RTCApp:
         else:
             icecandidate.sdpMLineIndex = ice.get('sdpMLineIndex')
 
-        if isinstance(icecandidate, RTCIceCandidate):
-            await peer_conn.addIceCandidate(icecandidate)
-        else:
-            raise RTCAppError("ERROR: ice candidate is not an instance of RTCIceCandidate")
+        await peer_conn.addIceCandidate(icecandidate)
 
     async def send_clipboard_data(self, data: Union[str, bytes], mime_type: str = "text/plain"):
         """Sends clipboard data over the data channel in chunks"""
@@ -252,7 +330,10 @@ class RTCApp:
                 }
             )
         else:
-            read = 0
+            # Encoding large clipboards would stall the event loop, so do it in the executor
+            b64_chunks = await self.async_event_loop.run_in_executor(
+                None, encode_clipboard_chunks, data_bytes, clipboard_chunk_size
+            )
             self.__send_data_channel_message(
                 "clipboard-msg-start",
                 {
@@ -261,19 +342,46 @@ class RTCApp:
                     "total_size": len(data_bytes),
                 }
             )
-            while read < len(data_bytes):
-                chunk = data_bytes[read:read + clipboard_chunk_size]
-                b64_encoded_chunk = base64.b64encode(chunk).decode("utf-8")
+            for b64_encoded_chunk in b64_chunks:
+                await self._wait_files_channel_drained()
                 self.__send_data_channel_message(
                     "clipboard-msg-data", {"content": b64_encoded_chunk}
                 )
-                read += len(chunk)
                 await asyncio.sleep(0)
             self.__send_data_channel_message("clipboard-msg-end", {})
 
-        logger.info(f"Sent clipboard data of length {len(data_bytes)} with mime type {mime_type}")
+        logger.info("Sent clipboard data of length %d with mime type %s", len(data_bytes), mime_type)
+
+    async def _wait_files_channel_drained(self):
+        """Waits until the data queued on the files channel has been handed to SCTP.
+        Returns right away if the channel is not open.
+        """
+        state, files_channel = self.get_data_channel("files_channel")
+        if not state or files_channel.bufferedAmount <= FILES_CHANNEL_BUFFER_THRESHOLD:
+            return
+
+        drained = self.async_event_loop.create_future()
 
-    def send_cursor_data(self, data: Any):
+        def on_drained(*args):
+            if not drained.done():
+                drained.set_result(None)
+
+        files_channel.on("bufferedamountlow", on_drained)
+        files_channel.on("close", on_drained)
+        try:
+            await drained
+        finally:
+            # A closed channel has already dropped all of its listeners
+            if files_channel.readyState != "closed":
+                files_channel.remove_listener("bufferedamountlow", on_drained)
+                files_channel.remove_listener("close", on_drained)
+
+    def send_cursor_data(self, data: Any, force: bool = False):
+        """Sends cursor data to the data channel, skipping unchanged cursors
+        unless force is set.
+        """
+        if not force and data == self.last_cursor_sent:
+            return
         self.last_cursor_sent = data
         self.__send_data_channel_message(
             "cursor", data)
@@ -313,7 +421,7 @@ class RTCApp:
 
     def send_encoder(self, encoder: str):
         """Sends the encoder name to the data channel"""
-        logger.info("sending encoder: " + encoder)
+        logger.info("sending encoder: %s", encoder)
         self.__send_data_channel_message(
             "system", {"action": "encoder,%s" % encoder})
 
@@ -326,7 +434,7 @@ class RTCApp:
 
     def send_remote_resolution(self, res: str):
         """sends the current remote resolution to the client"""
-        logger.info("sending remote resolution of: " + res)
+        logger.info("sending remote resolution of: %s", res)
         self.__send_data_channel_message(
             "system", {"action": "resolution," + res})
 
@@ -349,31 +457,95 @@ class RTCApp:
                 "mem_used": mem_used,
             })
 
-    def get_data_channel(self):
+    def get_data_channel(self, channel_key: str = "data_channel"):
         """Checks to see if the data channel is open"""
         state = False
         peer_obj = self.get_controller_instance()
         if not peer_obj:
             return state, None
 
+        data_channel = peer_obj.get(channel_key)
+        if data_channel is None:
+            return state, None
+
         conn_state = peer_obj.get("peer_conn").connectionState
-        data_channel_state = peer_obj.get("data_channel").readyState
-        return conn_state == "connected" and data_channel_state == "open", peer_obj.get("data_channel")
+        return conn_state == "connected" and data_channel.readyState == "open", data_channel
 
     def __send_data_channel_message(self, msg_type: str, data: Any):
-        """Sends message to the peer through the data channel.
-        Message is dropped if the channel is not open.
+        """Queues message to be sent to the peer through the data channel.
+        Messages queued within the same event loop tick are coalesced into
+        a single "batch" message. Message is dropped if the channel is not open.
         """
         if not self.peer_connections:
             return
 
-        state, data_channel = self.get_data_channel()
+        if msg_type in STATS_MESSAGE_TYPES:
+            channel_key = "stats_channel"
+        elif msg_type in FILES_MESSAGE_TYPES:
+            channel_key = "files_channel"
+        else:
+            channel_key = "data_channel"
+        state, data_channel = self.get_data_channel(channel_key)
+        if not state:
+            logger.info("skipping message because data channel is not ready: %s", msg_type)
+            return
+
+        msg = json_dumps({"type": msg_type, "data": data})
+        if channel_key == "stats_channel" and (
+            self._stats_backlog or data_channel.bufferedAmount > STATS_CHANNEL_BUFFER_THRESHOLD
+        ):
+            # Hold the latest message of each type back until the channel drains
+            if msg_type not in STATS_DROPPABLE_TYPES:
+                self._stats_backlog[msg_type] = msg
+            return
+
+        self._queue_msg(channel_key, msg)
+
+    def _queue_msg(self, channel_key: str, msg: str):
+        """Adds a serialized message to the batch of the given data channel"""
+        # The batch limit is in UTF-8 bytes; orjson doesn't escape non-ASCII
+        # characters, so len() of the string alone may undercount
+        size = len(msg) if msg.isascii() else len(msg.encode("utf-8"))
+        if self._pending_size[channel_key] + size > DATA_CHANNEL_BATCH_SIZE:
+            self._flush_channel(channel_key)
+
+        self._pending_msgs[channel_key].append(msg)
+        self._pending_size[channel_key] += size
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.async_event_loop.call_soon_threadsafe(self._flush_pending)
+
+    def _drain_stats_backlog(self):
+        """Queues held back stats messages once the stats channel has drained"""
+        backlog = self._stats_backlog
+        self._stats_backlog = {}
+        for msg in backlog.values():
+            self._queue_msg("stats_channel", msg)
+
+    def _flush_pending(self):
+        """Sends all queued messages, one message per data channel"""
+        self._flush_scheduled = False
+        for channel_key in self._pending_msgs:
+            self._flush_channel(channel_key)
+
+    def _flush_channel(self, channel_key: str):
+        """Sends the messages queued for a data channel in one message"""
+        msgs = self._pending_msgs[channel_key]
+        if not msgs:
+            return
+
+        self._pending_msgs[channel_key] = []
+        self._pending_size[channel_key] = 0
+
+        state, data_channel = self.get_data_channel(channel_key)
         if not state:
-            logger.info("skipping message because data channel is not ready: %s" % msg_type)
+            logger.info("dropping %d queued messages because data channel is not ready", len(msgs))
             return
 
-        msg = {"type": msg_type, "data": data}
-        data_channel.send(json.dumps(msg))
+        if len(msgs) == 1:
+            data_channel.send(msgs[0])
+        else:
+            data_channel.send('{"type": "batch", "data": [%s]}' % ", ".join(msgs))
 
     def send_media_data_over_channel(self, msg_type, data):
         self.__send_data_channel_message(msg_type, data)
@@ -387,10 +559,10 @@ class RTCApp:
         # rtx-time needs to be set to 125 milliseconds for optimal performance
         if 'rtx-time' not in sdp_text:
             logger.warning("injecting rtx-time to SDP")
-            sdp_text = re.sub(r'(apt=\d+)', r'\1;rtx-time=125', sdp_text)
+            sdp_text = RTX_APT_REGEX.sub(r'\1;rtx-time=125', sdp_text)
         elif 'rtx-time=125' not in sdp_text:
             logger.warning("injecting modified rtx-time to SDP")
-            sdp_text = re.sub(r'rtx-time=\d+', r'rtx-time=125', sdp_text)
+            sdp_text = RTX_TIME_REGEX.sub(r'rtx-time=125', sdp_text)
         # Enable sps-pps-idr-in-keyframe=1 in H.264 and H.265
         if "h264" in self.encoder or "x264" in self.encoder or "h265" in self.encoder or "x265" in self.encoder:
             if 'sps-pps-idr-in-keyframe' not in sdp_text:
@@ -398,38 +570,30 @@ class RTCApp:
                 sdp_text = sdp_text.replace('packetization-mode=', 'sps-pps-idr-in-keyframe=1;packetization-mode=')
             elif 'sps-pps-idr-in-keyframe=1' not in sdp_text:
                 logger.warning("injecting modified sps-pps-idr-in-keyframe to SDP")
-                sdp_text = re.sub(r'sps-pps-idr-in-keyframe=\d+', r'sps-pps-idr-in-keyframe=1', sdp_text)
+                sdp_text = SPS_PPS_IDR_REGEX.sub(r'sps-pps-idr-in-keyframe=1', sdp_text)
         if "opus/" in sdp_text.lower():
             # OPUS_FRAME: Add ptime explicitly to SDP offer
-            sdp_text = re.sub(r'([^-]sprop-[^\r\n]+)', r'\1\r\na=ptime:10', sdp_text)
+            sdp_text = OPUS_SPROP_REGEX.sub(r'\1\r\na=ptime:10', sdp_text)
 
         return sdp_text
 
     async def consume_data(self, buf, pts, kind):
         if kind == "video":
-            if buf:
+            # Don't allocate a packet nobody is going to consume
+            bridge = self.video_pipeline_bridge
+            if buf and bridge is not None:
                 try:
-                    packet = av.Packet(bytes(buf))
-                    RTP_VIDEO_CLOCK_RATE = 90000
-                    packet.time_base = Fraction(1, RTP_VIDEO_CLOCK_RATE)
-                    if pts is not None:
-                        packet.pts = pts
-                        packet.dts = packet.pts
-                    if self.video_pipeline_bridge is not None:
-                        await self.video_pipeline_bridge.set_data(packet)
+                    packet = build_packet(buf, self._video_time_base, pts, set_dts=True)
+                    bridge.set_data(packet)
                 except Exception as e:
-                    logger.error(f"error processing video sample: {e}")
+                    logger.error("error processing video sample: %s", e)
         elif kind == "audio":
-            if buf:
+            bridge = self.audio_pipeline_bridge
+            if buf and bridge is not None:
                 try:
-                    packet = av.Packet(bytes(buf))
-                    packet.time_base = Fraction(1, 48000)
-                    if pts is not None:
-                        packet.pts = pts
-                    if self.audio_pipeline_bridge is not None:
-                        await self.audio_pipeline_bridge.set_data(packet)
+                    bridge.set_data(build_packet(buf, self._audio_time_base, pts))
                 except Exception as e:
-                    logger.error(f"error processing audio sample: {e}")
+                    logger.error("error processing audio sample: %s", e)
 
     def update_rtc_config(self, stun_servers: List[str], turn_servers: List[str]):
         """Updates the RTC configuration with new STUN and TURN servers."""
@@ -439,6 +603,7 @@ class RTCApp:
         # renegotiation logic would need to be implemented in aiortc.
         self.stun_servers = stun_servers
         self.turn_servers = turn_servers
+        self._ice_servers = self.build_ice_servers(stun_servers, turn_servers)
         logger.warning("aiortc doesn't support ICE servers updation yet")
 
     def format_turn_servers(self, turn_servers: List[str]):
@@ -489,15 +654,15 @@ class RTCApp:
             formatted_servers.append("".join(server))
         return formatted_servers
 
-    def get_rtc_config(self):
-        # Format TURN servers
-        formatted_turn_servers = self.format_turn_servers(self.turn_servers)
-        formatted_stun_servers = self.format_stun_servers(self.stun_servers)
-        logger.debug(f"stun servers: {formatted_stun_servers}")
-        logger.debug(f"turn servers: {formatted_turn_servers}")
+    def build_ice_servers(self, stun_servers: List[str], turn_servers: List[str]) -> List[RTCIceServer]:
+        """Parses STUN and TURN server strings into RTCIceServer objects"""
+        formatted_turn_servers = self.format_turn_servers(turn_servers)
+        formatted_stun_servers = self.format_stun_servers(stun_servers or [])
+        logger.debug("stun servers: %s", formatted_stun_servers)
+        logger.debug("turn servers: %s", formatted_turn_servers)
 
         ice_servers = []
-        if self.stun_servers:
+        if formatted_stun_servers:
             ice_servers.append(RTCIceServer(urls=formatted_stun_servers))
         for turn in formatted_turn_servers:
             turn_kwargs: Dict[str, Any] = {
@@ -508,8 +673,10 @@ class RTCApp:
             if turn.get('credential') is not None:
                 turn_kwargs['credential'] = turn.get('credential')
             ice_servers.append(RTCIceServer(**turn_kwargs))
-        config = RTCConfiguration(iceServers=ice_servers, bundlePolicy=RTCBundlePolicy.MAX_BUNDLE)
-        return config
+        return ice_servers
+
+    def get_rtc_config(self):
+        return RTCConfiguration(iceServers=self._ice_servers, bundlePolicy=RTCBundlePolicy.MAX_BUNDLE)
 
     def force_codec(self, pc: RTCPeerConnection, sender: RTCRtpSender, forced_codec_mime: str):
         """
@@ -517,7 +684,7 @@ class RTCApp:
         """
         kind = sender.track.kind
         capabilities = RTCRtpSender.getCapabilities(kind)
-        logger.debug(f"Current capabilities for {kind}: {capabilities}")
+        logger.debug("Current capabilities for %s: %s", kind, capabilities)
 
         # Collect all codecs matching the given MIME type (e.g., all H264 codecs which may include different profiles)
         chosen_codec = []
@@ -539,7 +706,7 @@ class RTCApp:
             raise ValueError(f"RTX codec for {forced_codec_mime} not found")
 
         transceiver = next(t for t in pc.getTransceivers() if t.sender == sender)
-        logger.debug(f"Forcing codec preferences to: {[*chosen_codec, rtx_codec]}")
+        logger.debug("Forcing codec preferences to: %s", [*chosen_codec, rtx_codec])
         transceiver.setCodecPreferences([*chosen_codec, rtx_codec])
 
     def on_datachannel(self, channel: RTCDataChannel, client_peer_id: str = None):
@@ -549,24 +716,25 @@ class RTCApp:
             channel        -- the RTCDataChannel object provided by the event
             client_peer_id -- optional id of the client peer associated with this channel
         """
-        logger.info(f"Auxiliary data channel opened: {channel.label}", extra={'client_peer_id': client_peer_id})
+        logger.info("Auxiliary data channel opened: %s", channel.label, extra={'client_peer_id': client_peer_id})
         self.aux_data_channel = channel
         self.aux_data_channel.on("close", lambda: logger.info("Auxiliary data channel closed"))
         self.aux_data_channel.on("error", lambda e: logger.error("Auxiliary data channel error: %s", e))
-        self.aux_data_channel.on("message", lambda data: asyncio.run_coroutine_threadsafe(self.on_data_msg_bytes(data), loop=self.async_event_loop))
+        # Data channel events are emitted on the event loop thread, no need for thread-safe scheduling
+        self.aux_data_channel.on("message", lambda data: self.async_event_loop.create_task(self.on_data_msg_bytes(data)))
 
     async def on_peer_connection_established(self, client_peer_id: str, client_type: ClientType):
         if client_type == ClientType.CONTROLLER:
             if self.media_pipeline:
                 await self.media_pipeline.start_media_pipeline()
-                logger.info(f"Media pipeline started for {client_peer_id}")
+                logger.info("Media pipeline started for %s", client_peer_id)
 
     async def on_peer_connection_lost(self, client_peer_id: str, client_type: ClientType):
         """Called when peer connection is lost or closed."""
         if client_type == ClientType.CONTROLLER:
             if self.media_pipeline:
                 await self.media_pipeline.stop_media_pipeline()
-                logger.info(f"Media pipeline stopped for {client_peer_id}")
+                logger.info("Media pipeline stopped for %s", client_peer_id)
 
     async def on_connectionstatechange(self, client_peer_id: str):
         """Handle connection state changes for a peer connection.
@@ -596,7 +764,7 @@ class RTCApp:
         elif state == "connecting":
             logger.info("Peer connection is connecting", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
         else:
-            logger.debug(f"Unhandled peer connection state: {state}", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
+            logger.debug("Unhandled peer connection state: %s", state, extra={'client_peer_id': client_peer_id, 'client_type': client_type})
 
     def on_pli(self, client_peer_id: str, client_type: str):
         logger.info("PLI occurred, triggering IDR frame request", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
@@ -617,6 +785,9 @@ class RTCApp:
 
             self.audio_pipeline_bridge = PipelineBridge()
             self.audio_media = AudioMedia(self.audio_pipeline_bridge)
+
+            # Stats held back for a previous controller would block new ones
+            self._stats_backlog.clear()
             logger.info("Media relay and pipeline bridges created for controller client")
 
         peer_connection =  RTCPeerConnection(self.get_rtc_config())
@@ -629,12 +800,25 @@ class RTCApp:
         rtp_video_sender.on("pli", lambda cid=client_peer_id, ct=client_type: self.on_pli(cid, ct))
         peer_connection.addTrack(self.media_relay.subscribe(self.audio_media))
 
-        # Primary data channel
-        data_channel = peer_connection.createDataChannel("input", ordered=True, maxRetransmits=0)
+        # Primary data channel, reliable and ordered for input and control messages
+        data_channel = peer_connection.createDataChannel("input", ordered=True)
+
+        # Unordered and unreliable data channel for periodic stats, avoids
+        # head-of-line blocking of the latest stats behind lost ones
+        stats_channel = peer_connection.createDataChannel("stats", ordered=False, maxRetransmits=0)
+        stats_channel.bufferedAmountLowThreshold = STATS_CHANNEL_BUFFER_THRESHOLD
+        stats_channel.on("bufferedamountlow", self._drain_stats_backlog)
+
+        # Reliable and ordered data channel for large payloads, keeps them
+        # from delaying messages on the input channel
+        files_channel = peer_connection.createDataChannel("files", ordered=True)
+        files_channel.bufferedAmountLowThreshold = FILES_CHANNEL_BUFFER_THRESHOLD
 
         # Assign event handlers for the input data channel
-        data_channel.on("open", self.on_data_open)
-        data_channel.on("message", lambda msg: asyncio.run_coroutine_threadsafe(self.on_data_message(msg), loop=self.async_event_loop))
+        data_channel.on("open", lambda: self.on_data_open())
+        data_channel.on("close", lambda: self.on_data_close())
+        data_channel.on("error", lambda e: self.on_data_error(e))
+        data_channel.on("message", lambda msg: self.async_event_loop.create_task(self.on_data_message(msg)))
 
         # A dynamic secondary data channel intended for file data transmission
         peer_connection.on("datachannel", lambda ch, cid=client_peer_id: self.on_datachannel(ch, cid))
@@ -648,16 +832,20 @@ class RTCApp:
         await peer_connection.setLocalDescription(await peer_connection.createOffer())
         offer = peer_connection.localDescription
 
-        sdp = offer.sdp
-        sdp = self.munge_sdp(sdp)
-        await self.on_sdp('offer', sdp, client_peer_id)
-
+        # Register the peer before the offer goes out, so that an answer or
+        # ICE candidates arriving right after it can be applied
         self.peer_connections[client_peer_id] = {
             "peer_conn": peer_connection,
             "data_channel": data_channel,
+            "stats_channel": stats_channel,
+            "files_channel": files_channel,
             "client_type": client_type
         }
 
+        sdp = offer.sdp
+        sdp = self.munge_sdp(sdp)
+        await self.on_sdp('offer', sdp, client_peer_id)
+
     def get_mime_by_encoder(self, encoder: str) -> Optional[str]:
         """Returns respective mime type by encoder name"""
 
@@ -678,7 +866,7 @@ class RTCApp:
 
             peer_obj = self.peer_connections.get(client_peer_id, None)
             if not peer_obj:
-                logger.warning(f"Peer object not found for client peer_id: {client_peer_id}")
+                logger.warning("Peer object not found for client peer_id: %s", client_peer_id)
                 return
 
             peer_conn = peer_obj.get("peer_conn")
@@ -693,6 +881,7 @@ class RTCApp:
                 logger.info("Controller peer disconnected, cleaning up media relay and bridges")
                 self.media_relay = None
                 self.aux_data_channel = None
+                self._stats_backlog.clear()
                 self.video_pipeline_bridge = None
                 self.audio_pipeline_bridge = None
         except Exception as e:
@@ -703,7 +892,7 @@ class RTCApp:
             logger.info("Starting RTC pipeline", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
             await self._start_rtc_pipeline(client_peer_id, client_type)
         except Exception as e:
-            logger.error(f"Error starting RTC pipeline: {e}", extra={'client_peer_id': client_peer_id, 'client_type': client_type}, exc_info=True)
+            logger.error("Error starting RTC pipeline: %s", e, extra={'client_peer_id': client_peer_id, 'client_type': client_type}, exc_info=True)
         else:
             logger.info("RTC pipeline started successfully", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
 
@@ -713,7 +902,7 @@ class RTCApp:
             logger.info("Stopping RTC pipeline", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
             await self._stop_rtc_pipeline(client_peer_id)
         except Exception as e:
-            logger.error(f"Error stopping RTC pipeline: {e}", extra={'client_peer_id': client_peer_id, 'client_type': client_type}, exc_info=True)
+            logger.error("Error stopping RTC pipeline: %s", e, extra={'client_peer_id': client_peer_id, 'client_type': client_type}, exc_info=True)
         else:
             logger.info("RTC pipeline stopped successfully", extra={'client_peer_id': client_peer_id, 'client_type': client_type})
 
@@ -726,6 +915,7 @@ class RTCApp:
 
             self.media_relay = None
             self.aux_data_channel = None
+            self._stats_backlog.clear()
             self.video_pipeline_bridge = None
             self.audio_pipeline_bridge = None
             logger.info("All RTC connections stopped, cleaned up media relay and bridges")
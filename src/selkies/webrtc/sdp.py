@@ -64,6 +64,10 @@ FMTP_INT_PARAMETERS = [
     "useinbandfec",
 ]
 
+CONNECTION_ADDRESS_REGEX = re.compile("^IN (IP4|IP6) ([^ ]+)$")
+MEDIA_LINE_REGEX = re.compile("^m=([^ ]+) ([0-9]+) ([A-Z/]+) (.+)$")
+PROFILE_LEVEL_ID_REGEX = re.compile("[0-9a-f]{6}", re.I)
+
 
 class BitPattern:
     def __init__(self, v: str) -> None:
@@ -182,7 +186,7 @@ def grouplines(sdp: str) -> tuple[list[str], list[list[str]]]:
 
 
 def ipaddress_from_sdp(sdp: str) -> str:
-    m = re.match("^IN (IP4|IP6) ([^ ]+)$", sdp)
+    m = CONNECTION_ADDRESS_REGEX.match(sdp)
     assert m
     return m.group(2)
 
@@ -225,9 +229,7 @@ def parse_attr(line: str) -> tuple[str, Optional[str]]:
 
 
 def parse_h264_profile_level_id(profile_str: str) -> tuple[H264Profile, H264Level]:
-    if not isinstance(profile_str, str) or not re.match(
-        "[0-9a-f]{6}", profile_str, re.I
-    ):
+    if not isinstance(profile_str, str) or not PROFILE_LEVEL_ID_REGEX.match(profile_str):
         raise ValueError("Expected a 6 character hexadecimal string")
 
     level_idc = int(profile_str[4:6], 16)
@@ -456,7 +458,7 @@ class SessionDescription:
 
         # parse media
         for media_lines in media_groups:
-            m = re.match("^m=([^ ]+) ([0-9]+) ([A-Z/]+) (.+)$", media_lines[0])
+            m = MEDIA_LINE_REGEX.match(media_lines[0])
             assert m
 
             # check payload types are valid
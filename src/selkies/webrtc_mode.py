@@ -357,7 +357,7 @@ class WebRTCService(BaseStreamingService):
         self.rtc_app.send_media_data_over_channel(
             "server_settings", server_settings_payload
         )
-        self.rtc_app.send_cursor_data(self.rtc_app.last_cursor_sent)
+        self.rtc_app.send_cursor_data(self.rtc_app.last_cursor_sent, force=True)
 
     async def handle_video_bitrate_change(self, bitrate: int) -> None:
         """Handle video bitrate change request."""